@@ -1,125 +1,409 @@
 import os
+import re
+import atexit
 import argparse
-import subprocess
+import shutil
+import asyncio
 import ipaddress
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import queue
+import threading
+import time
 from collections import defaultdict
 
-def run_nmap_scan(subnet, nmap_output_file, timeout):
+BATCH_SIZE = 64  # Tek bir nmap sürecine verilecek /24 sayısı
+MAX_PARALLEL_BATCHES = 3  # Aynı anda çalışacak nmap süreci sayısı
+MASSCAN_RATE = 100000  # --fast modunda masscan'in saniyede göndereceği paket sayısı
+FPING_PARALLEL = 8  # Ön taramada aynı anda çalışacak fping süreci sayısı (her biri bir /16)
+FPING_INTERVAL_MS = 1  # fping paketleri arasındaki bekleme (-i, milisaniye)
+PROGRESS_INTERVAL = 30.0  # İlerleme kaydı aralığı (saniye)
+FLUSH_EVERY_BATCHES = 16  # Bu kadar grup biriktiğinde tampon boyutundan bağımsız olarak diske yaz
+WRITE_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE * 64  # Dosyaya yazmadan önce biriktirilecek veri miktarı
+_IPV4_RE = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+
+async def run_nmap_scan(subnets, timeout, sem):
     """
-    Belirtilen subnet için nmap -sn taraması yapar, sonuçları kaydeder ve timeout uygular.
+    Verilen subnet grubunu tek bir nmap -sn süreciyle tarar (-iL ile stdin üzerinden),
+    timeout uygular ve (grup, grepable (-oG) çıktı, tamamlandı mı) üçlüsünü döndürür.
+    Çıktı satır satır okunur; timeout olursa o ana kadar gelen kısmi sonuçlar korunur.
+    Aynı anda çalışan nmap süreci sayısı sem ile sınırlanır.
     """
-    print(f"[+] Subnet taranıyor: {subnet}")
-    try:
-        result = subprocess.run(
-            ["nmap", "-sn", subnet],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=timeout  # Timeout süresi burada belirtiliyor
+    batch = f"{subnets[0]} - {subnets[-1]}"
+    async with sem:
+        print(f"[+] Subnet grubu taranıyor: {batch}")
+        lines = []
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "nmap", "-sn", "-iL", "-", "-oG", "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            proc.stdin.write("\n".join(subnets).encode())
+            await proc.stdin.drain()
+            proc.stdin.close()
+
+            async def read_output():
+                async for line in proc.stdout:
+                    lines.append(line)
+                await proc.wait()
+
+            try:
+                # Timeout süresi burada belirtiliyor
+                await asyncio.wait_for(read_output(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                print(f"[!] Timeout: {batch} taraması belirtilen sürede tamamlanamadı, kısmi sonuçlar kaydediliyor.")
+                return batch, b"".join(lines).decode(), False
+            print(f"[+] Taraması tamamlandı: {batch}")
+            return batch, b"".join(lines).decode(), True
+        except Exception as e:
+            print(f"[!] Hata: {e}")
+            return batch, b"".join(lines).decode(), False
+
+async def run_masscan(network, output_file):
+    """
+    Tüm ağı tek bir masscan --ping süreciyle tarar ve listeleme (-oL) çıktısını dosyaya yazar.
+    masscan başarısız olursa False döner.
+    """
+    print(f"[+] masscan ile hızlı tarama başlatıldı: {network}")
+    proc = await asyncio.create_subprocess_exec(
+        "masscan", network, "-p0", "--ping", "--rate", str(MASSCAN_RATE), "-oL", output_file,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    returncode = await proc.wait()
+    if returncode != 0 or not os.path.exists(output_file):
+        print(f"[!] masscan taraması başarısız oldu (çıkış kodu: {returncode}).")
+        return False
+    print(f"[+] masscan taraması tamamlandı: {network}")
+    return True
+
+async def fping_sweep(network, sem):
+    """
+    Tek bir ağı fping ile tarar; (çıkış kodu, aktif /24 ağ adresleri kümesi) döndürür.
+    """
+    alive24 = set()
+    async with sem:
+        proc = await asyncio.create_subprocess_exec(
+            "fping", "-a", "-q", "-g", network, "-r", "0", "-t", "100", "-i", str(FPING_INTERVAL_MS),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
         )
-        with open(nmap_output_file, "a") as f:
-            f.write(f"[+] Nmap taraması tamamlandı: {subnet}\nÇıktı:\n{result.stdout}\n")
-        print(f"[+] Taraması tamamlandı: {subnet}, sonuç dosyaya yazıldı.")
-        return result.stdout
-    except subprocess.TimeoutExpired:
-        print(f"[!] Timeout: {subnet} taraması belirtilen sürede tamamlanamadı.")
-        return ""
-    except Exception as e:
-        print(f"[!] Hata: {e}")
-        return ""
+        async for line in proc.stdout:
+            ip = line.decode().strip()
+            if _IPV4_RE.match(ip):
+                alive24.add(subnet_to_int(ip) & 0xFFFFFF00)
+        return await proc.wait(), alive24
+
+async def build_alive_bitmap(base_network, start_network=None):
+    """
+    Ağı /16 parçalar halinde fping ile tarar (kaldığı yerden başlayarak) ve en az bir aktif
+    hostu olan /24'lerin ağ adreslerini (tamsayı) küme olarak döndürür.
+    fping yoksa, hata verirse (çıkış kodu >= 2) ya da hiç aktif host bulamazsa None döner;
+    bu durumda ön eleme yapılmaz.
+    """
+    if not shutil.which("fping"):
+        print("[!] fping bulunamadı, tüm /24'ler nmap ile taranacak.")
+        return None
+
+    base_int = int(base_network.network_address)
+    end_int = base_int + base_network.num_addresses
+    start_int = max(base_int, int(start_network.network_address)) if start_network else base_int
+    networks = [f"{n >> 24}.{(n >> 16) & 0xff}.0.0/16" for n in range(start_int & 0xFFFF0000, end_int, 1 << 16)]
+
+    print(f"[+] fping ile ön tarama yapılıyor: {networks[0]} - {networks[-1]}")
+    sem = asyncio.Semaphore(FPING_PARALLEL)
+    results = await asyncio.gather(*(fping_sweep(network, sem) for network in networks))
+
+    alive24 = set()
+    for network, (returncode, alive) in zip(networks, results):
+        # 0: hepsi aktif, 1: bazıları ulaşılamaz; daha büyük kodlar fping hatasıdır
+        if returncode >= 2:
+            print(f"[!] fping {network} için hata verdi (çıkış kodu: {returncode}), ön eleme yapılmayacak.")
+            return None
+        alive24 |= alive
+    if not alive24:
+        print("[!] fping hiç aktif host bulamadı, ön eleme yapılmayacak.")
+        return None
+    print(f"[+] Ön tarama tamamlandı: {len(alive24)} /24 içinde aktif host bulundu.")
+    return alive24
+
+def write_nmap_output(nmap_output_file, out_q, on_flushed):
+    """
+    Kuyruktaki tarama sonuçlarını tek bir dosya tanıtıcısı üzerinden, büyük bloklar halinde yazar.
+    Tampon WRITE_BUFFER_SIZE'a ulaştığında, FLUSH_EVERY_BATCHES grup biriktiğinde ya da son
+    yazmadan bu yana PROGRESS_INTERVAL saniye geçtiğinde diske aktarılır.
+    Her flush'tan sonra diske aktarılan grupların (sıra, son subnet, tamamlandı mı) bilgisini
+    on_flushed ile bildirir. Kuyruğa None konulduğunda kalan veriyi yazıp çıkar.
+    """
+    buffer = []
+    pending = []  # Tamponda bekleyen grupların ilerleme bilgisi
+    buffered = 0
+    last_flush = time.monotonic()
+
+    def flush():
+        nonlocal buffer, pending, buffered, last_flush
+        f.write("".join(buffer))
+        f.flush()
+        on_flushed(pending)
+        buffer = []
+        pending = []
+        buffered = 0
+        last_flush = time.monotonic()
+
+    with open(nmap_output_file, "a") as f:
+        while True:
+            # Bir sonraki zamanlı yazmaya kalan süre kadar bekle
+            wait = max(0.0, last_flush + PROGRESS_INTERVAL - time.monotonic())
+            try:
+                item = out_q.get(timeout=wait if pending else PROGRESS_INTERVAL)
+                if item is None:
+                    break
+                index, subnet, completed, batch, stdout = item
+                chunk = f"[+] Nmap taraması tamamlandı: {batch}\nÇıktı:\n{stdout}\n"
+                buffer.append(chunk)
+                pending.append((index, subnet, completed))
+                buffered += len(chunk)
+            except queue.Empty:
+                pass
+            if pending and (buffered >= WRITE_BUFFER_SIZE
+                            or len(pending) >= FLUSH_EVERY_BATCHES
+                            or time.monotonic() - last_flush >= PROGRESS_INTERVAL):
+                flush()
+        flush()
+
+def subnet_to_int(subnet):
+    """
+    "a.b.c.0/24" biçimindeki subnetin ağ adresini tamsayıya çevirir (sayısal sıralama için).
+    """
+    a, b, c, d = subnet.split("/", 1)[0].split(".")
+    return (int(a) << 24) | (int(b) << 16) | (int(c) << 8) | int(d)
 
 def parse_nmap_output(nmap_output_file):
     """
-    Nmap çıktı dosyasından aktif subnetleri ve hostları ayrıştırır.
-    Bir subnet altında en az 2 aktif host varsa subneti ekler.
+    Nmap grepable (-oG) çıktı dosyasından aktif subnetleri ve hostları ayrıştırır.
+    Bir subnet altında en az 2 aktif host varsa subneti (ağ adresi tamsayısı, subnet) olarak ekler.
     """
     active_subnets = set()
-    active_hosts = defaultdict(list)  # Subnet -> Host listesi
+    # Subnet -> {IP: host}; devam ettirme ve timeout sonrası tekrar taramada aynı host birden
+    # fazla raporlanabilir, eşik tekil IP'ler üzerinden sayılır
+    active_hosts = defaultdict(dict)
 
     with open(nmap_output_file, "r") as f:
-        output = f.read()
-        lines = output.splitlines()
-        for i, line in enumerate(lines):
-            if "Nmap scan report for" in line:
-                host = line.replace("Nmap scan report for ", "").strip()
-                if "(" in host:  # Eğer hostname varsa (hostname (IP))
-                    ip = host.split("(")[-1].strip(")")
+        # Dosya satır satır okunur; çıktı tamamı belleğe alınmaz
+        for line in f:
+            # Örnek: "Host: 10.0.0.1 (hostname)\tStatus: Up"
+            if line.startswith("Host:") and "Status: Up" in line:
+                fields = line.split("\t", 1)[0].split()
+                ip = fields[1]
+                hostname = fields[2].strip("()") if len(fields) > 2 else ""
+                host = f"{hostname} ({ip})" if hostname else ip
+
+                if _IPV4_RE.match(ip):
+                    # Subneti IP adresinden türet (son okteti 0 yap)
+                    subnet = ip[:ip.rfind(".")] + ".0/24"
                 else:
-                    ip = host
+                    # Beklenmeyen biçimler için tam ayrıştırmaya geri dön
+                    try:
+                        subnet = str(ipaddress.IPv4Network(f"{ip}/24", strict=False))
+                    except Exception:
+                        continue
+                # Hostname içeren kayıt varsa onu tercih et
+                if hostname or ip not in active_hosts[subnet]:
+                    active_hosts[subnet][ip] = host
+
+    # Subnet altında en az 2 host varsa aktif subnetler listesine ekle
+    for subnet, hosts in active_hosts.items():
+        if len(hosts) >= 2:
+            active_subnets.add((subnet_to_int(subnet), subnet))
 
-                try:
-                    # Subneti IP adresinden türet
-                    subnet = str(ipaddress.IPv4Network(f"{ip}/24", strict=False))
-                    active_hosts[subnet].append(host)
-                except Exception:
-                    continue
+    return active_subnets, {subnet: list(hosts.values()) for subnet, hosts in active_hosts.items()}
+
+def parse_masscan_output(masscan_output_file):
+    """
+    masscan listeleme (-oL) çıktı dosyasından aktif subnetleri ve hostları ayrıştırır.
+    Bir subnet altında en az 2 aktif host varsa subneti (ağ adresi tamsayısı, subnet) olarak ekler.
+    """
+    active_subnets = set()
+    active_hosts = defaultdict(set)  # Subnet -> Host kümesi (aynı IP birden fazla raporlanabilir)
+
+    with open(masscan_output_file, "r") as f:
+        for line in f:
+            # Örnek: "open icmp 0 10.0.0.1 1700000000"
+            if line.startswith("#"):
+                continue
+            fields = line.split()
+            if len(fields) < 4:
+                continue
+            ip = fields[3]
+            subnet = ip[:ip.rfind(".")] + ".0/24"
+            active_hosts[subnet].add(ip)
 
     # Subnet altında en az 2 host varsa aktif subnetler listesine ekle
     for subnet, hosts in active_hosts.items():
         if len(hosts) >= 2:
-            active_subnets.add(subnet)
+            active_subnets.add((subnet_to_int(subnet), subnet))
 
-    return active_subnets, active_hosts
+    # Host listeleri nmap çıktısıyla aynı biçimde, son oktete göre sıralı döndürülür
+    return active_subnets, {subnet: sorted(hosts, key=lambda ip: int(ip[ip.rfind(".") + 1:]))
+                            for subnet, hosts in active_hosts.items()}
 
 def save_to_file(file_path, data):
     """
-    Verilen verileri belirtilen dosyaya kaydeder.
+    (sıralama anahtarı, değer) ikililerini anahtara göre sıralayıp değerleri dosyaya kaydeder.
     """
     with open(file_path, "w") as f:
-        for item in sorted(data):
+        for _, item in sorted(data):
             f.write(f"{item}\n")
 
-def scan_networks(output_file_subnets, output_file_hosts, progress_file, nmap_output_file, timeout):
-    print("[+] Ağ taraması başlatılıyor...")
-    base_network = ipaddress.ip_network("10.0.0.0/8")
+def iter_subnet_batches(base_network, start_network, batch_size, alive24=None):
+    """
+    Taranacak /24 subnetlerini batch_size uzunluğunda gruplar halinde üretir.
+    alive24 verilmişse yalnızca içinde aktif host bulunan /24'ler üretilir.
+    """
+    base_int = int(base_network.network_address)
+    end_int = base_int + base_network.num_addresses
+    # Kayıtlı subnet tamamlanmış son /24'tür; tarama bir sonrakinden devam eder.
+    # Karşılaştırmalar tamamen tamsayı üzerinden yapılır
+    if start_network:
+        start_int = max(base_int, (int(start_network.network_address) & 0xFFFFFF00) + 256)
+    else:
+        start_int = base_int
+
+    batch = []
+    for n in range(start_int, end_int, 256):
+        if alive24 is not None and n not in alive24:
+            continue  # Ön taramada aktif host bulunmayan subnetleri atla
 
+        batch.append(f"{n >> 24}.{(n >> 16) & 0xff}.{(n >> 8) & 0xff}.0/24")
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+async def nmap_sweep(base_network, progress_file, nmap_output_file, timeout, prefilter=True):
+    """
+    Ağı /24 grupları halinde nmap -sn ile tarar; ilerlemeyi kaydeder ve kaldığı yerden devam eder.
+    prefilter açıksa önce fping ile boş /24'ler elenir.
+    """
     # Durum yükleme
     start_network = load_progress(progress_file)
     start_network = ipaddress.ip_network(start_network) if start_network else None
 
-    with ThreadPoolExecutor(max_workers=10) as executor:  # Paralel tarama için iş parçacığı sayısı
-        scan_futures = {}
+    alive24 = await build_alive_bitmap(base_network, start_network) if prefilter else None
 
-        for subnet_16 in base_network.subnets(new_prefix=16):
-            for subnet_24 in subnet_16.subnets(new_prefix=24):
-                if start_network and subnet_24 < start_network:
-                    continue  # Önceden taranan subnetleri atla
+    # İlerleme yalnızca diske aktarılmış ve kesintisiz tamamlanmış grupların sonuncusuna kadar ilerler.
+    # Önceki bir grup henüz bitmemişse ya da timeout aldıysa sonraki gruplar kaydedilmez.
+    progress = {"next": 0, "flushed": {}, "subnet": None}
+    progress_lock = threading.Lock()
+    stop_checkpoint = threading.Event()
 
-                print(f"[+] Taranıyor: {subnet_24}")
-                scan_futures[executor.submit(run_nmap_scan, str(subnet_24), nmap_output_file, timeout)] = str(subnet_24)
+    def on_flushed(items):
+        with progress_lock:
+            for index, subnet, completed in items:
+                progress["flushed"][index] = (subnet, completed)
+            while progress["next"] in progress["flushed"]:
+                subnet, completed = progress["flushed"][progress["next"]]
+                if not completed:
+                    break
+                del progress["flushed"][progress["next"]]
+                progress["subnet"] = subnet
+                progress["next"] += 1
 
-        for future in as_completed(scan_futures):
-            subnet = scan_futures[future]
-            try:
-                future.result()
-            except Exception as e:
-                print(f"[!] Hata {subnet} için: {e}")
+    def flush_progress():
+        with progress_lock:
+            if progress["subnet"]:
+                save_progress(progress_file, progress["subnet"])
+
+    def checkpoint_loop():
+        while not stop_checkpoint.wait(PROGRESS_INTERVAL):
+            flush_progress()
 
-            # Durumu kaydet
-            save_progress(progress_file, subnet)
+    # Nmap çıktısını tek bir yazıcı iş parçacığı dosyaya aktarır
+    out_q = queue.Queue()
+    writer_thread = threading.Thread(target=write_nmap_output, args=(nmap_output_file, out_q, on_flushed))
+    writer_thread.start()
+
+    checkpoint_thread = threading.Thread(target=checkpoint_loop, daemon=True)
+    checkpoint_thread.start()
+    atexit.register(flush_progress)  # KeyboardInterrupt gibi erken çıkışlarda son durumu kaydet
+
+    sem = asyncio.Semaphore(MAX_PARALLEL_BATCHES)  # nmap kendi içinde paralel çalışır
+
+    async def scan(index, batch):
+        # İlerleme kaydı için grubun sırası ve son subneti tutulur
+        return index, batch[-1], await run_nmap_scan(batch, timeout, sem)
+
+    try:
+        tasks = []
+        for index, batch in enumerate(iter_subnet_batches(base_network, start_network, BATCH_SIZE, alive24)):
+            print(f"[+] Taranıyor: {batch[0]} - {batch[-1]}")
+            tasks.append(asyncio.ensure_future(scan(index, batch)))
+
+        for next_done in asyncio.as_completed(tasks):
+            index, subnet, (batch, stdout, completed) = await next_done
+            # Timeout veya hata alan grup tamamlanmış sayılmaz
+            out_q.put((index, subnet, completed, batch, stdout))
+    finally:
+        # Hata veya kesinti durumunda da yazıcı iş parçacığı kapanmalı, yoksa süreç asılı kalır
+        out_q.put(None)
+        writer_thread.join()
+
+    stop_checkpoint.set()
+    checkpoint_thread.join()
+    flush_progress()
+    atexit.unregister(flush_progress)
+
+async def scan_networks(output_file_subnets, output_file_hosts, progress_file, nmap_output_file, timeout, fast=False, prefilter=True):
+    print("[+] Ağ taraması başlatılıyor...")
+    base_network = ipaddress.ip_network("10.0.0.0/8")
+
+    # masscan -oL çıktı dosyasını her seferinde sıfırlar; nmap çıktısının üzerine yazmaması için ayrı dosya kullanılır
+    masscan_output_file = f"{nmap_output_file}.masscan"
+    if fast and not shutil.which("masscan"):
+        print("[!] masscan bulunamadı, nmap -sn taramasına geri dönülüyor.")
+        fast = False
+    if fast and not await run_masscan(str(base_network), masscan_output_file):
+        print("[!] nmap -sn taramasına geri dönülüyor.")
+        fast = False
+
+    if fast:
+        output_file, parse_output = masscan_output_file, parse_masscan_output
+    else:
+        await nmap_sweep(base_network, progress_file, nmap_output_file, timeout, prefilter)
+        output_file, parse_output = nmap_output_file, parse_nmap_output
 
     print("\n[+] Tarama tamamlandı. Çıktılar işleniyor...")
-    active_subnets, active_hosts = parse_nmap_output(nmap_output_file)
+    # Ayrıştırma bloklayıcı olduğu için olay döngüsü dışında çalıştırılır
+    loop = asyncio.get_running_loop()
+    active_subnets, active_hosts = await loop.run_in_executor(None, parse_output, output_file)
 
     # Aktif subnetleri ve hostları kaydet
     print(f"[+] Aktif subnetler '{output_file_subnets}' dosyasına yazılıyor.")
     save_to_file(output_file_subnets, active_subnets)
     print(f"[+] Aktif hostlar '{output_file_hosts}' dosyasına yazılıyor.")
-    with open(output_file_hosts, "w") as f:
-        for subnet, hosts in active_hosts.items():
-            if len(hosts) >= 2:
-                f.write(f"Subnet: {subnet}\n")
-                for host in hosts:
-                    f.write(f"  {host}\n")
-                f.write("\n")
+    # Çıktı bellekte birleştirilip tek seferde yazılır
+    parts = []
+    parts_append = parts.append
+    for subnet, hosts in active_hosts.items():
+        if len(hosts) >= 2:
+            parts_append(f"Subnet: {subnet}\n")
+            parts_append("".join(f"  {host}\n" for host in hosts))
+            parts_append("\n")
+    with open(output_file_hosts, "w", buffering=1024 * 1024) as f:
+        f.write("".join(parts))
 
 def save_progress(file_path, current_network):
     """
-    Durumu kaydeder.
+    Durumu geçici dosyaya yazıp yerine taşıyarak atomik olarak kaydeder.
     """
-    with open(file_path, "w") as f:
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w") as f:
         f.write(current_network)
+    os.replace(tmp_path, file_path)
 
 def load_progress(file_path):
     """
@@ -135,8 +419,10 @@ if __name__ == "__main__":
     parser.add_argument("-s", "--subnet-output", required=True, help="Aktif subnetlerin kaydedileceği dosya yolu")
     parser.add_argument("-ho", "--host-output", required=True, help="Aktif hostların kaydedileceği dosya yolu")
     parser.add_argument("-p", "--progress", required=True, help="Durum bilgisinin kaydedileceği dosya yolu")
-    parser.add_argument("-n", "--nmap-output", required=True, help="Nmap tarama sonuçlarının kaydedileceği dosya yolu")
-    parser.add_argument("-t", "--timeout", type=int, default=60, help="Her tarama için timeout süresi (saniye)")
+    parser.add_argument("-n", "--nmap-output", required=True, help="Nmap tarama sonuçlarının kaydedileceği dosya yolu (--fast ile masscan çıktısı <yol>.masscan dosyasına yazılır)")
+    parser.add_argument("-t", "--timeout", type=int, default=600, help="Her nmap grubu için timeout süresi (saniye)")
+    parser.add_argument("-f", "--fast", action="store_true", help="Keşif için masscan --ping kullan (yoksa nmap -sn)")
+    parser.add_argument("--no-prefilter", action="store_true", help="fping ön taramasını atla, tüm /24'leri nmap ile tara")
     args = parser.parse_args()
 
     # Kontrol için root yetkisi gerekliliği
@@ -144,4 +430,4 @@ if __name__ == "__main__":
         print("[!] Bu aracı çalıştırmak için root yetkisi gereklidir.")
         exit(1)
 
-    scan_networks(args.subnet_output, args.host_output, args.progress, args.nmap_output, args.timeout)
+    asyncio.run(scan_networks(args.subnet_output, args.host_output, args.progress, args.nmap_output, args.timeout, args.fast, not args.no_prefilter))
@@ -1,10 +1,16 @@
-import nmap
+import os
+import json
 import argparse
+import ipaddress
+import io
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from time import sleep
 import random
 
+BATCH_SIZE = 64  # Tek bir nmap sürecine verilecek en fazla hedef sayısı
+
 # Ağ arayüzünün mevcut IP adresini alır
 def get_interface_ip(interface):
     try:
@@ -44,16 +50,116 @@ def reset_interface(interface):
     except Exception as e:
         print(f"Failed to reset interface {interface}: {e}")
 
-# IP/subnet listesini bir dosyadan okur
+# Ağın kendisi veya üst bloklarından biri blocks kümesinde mi
+def is_covered(network, blocks):
+    return any(network.supernet(new_prefix=p) in blocks for p in range(network.prefixlen + 1))
+
+# IP/subnet listesini bir dosyadan okur; tekrar eden ve başka bir bloğun içinde kalan hedefleri çıkarır.
+# Komşu bloklar birleştirilmez, böylece hedef sayısı (hosts_limit, BATCH_SIZE) anlamını korur.
 def read_targets(file_path):
     try:
         with open(file_path, 'r') as f:
             targets = [line.strip() for line in f if line.strip()]
-        return targets
     except Exception as e:
         print(f"Error reading file: {e}")
         return []
 
+    parsed = []
+    for target in targets:
+        try:
+            parsed.append((target, ipaddress.ip_network(target, strict=False)))
+        except ValueError:
+            parsed.append((target, None))  # Hostname gibi ağ olarak ayrıştırılamayan hedefler
+
+    # Büyük bloklardan küçüğe doğru ilerleyerek iç içe geçenleri ele
+    kept = set()
+    for _, network in sorted((item for item in parsed if item[1] is not None),
+                             key=lambda item: (item[1].version, item[1].prefixlen)):
+        if not is_covered(network, kept):
+            kept.add(network)
+
+    # Girdi sırası korunur
+    result = []
+    seen = set()
+    for target, network in parsed:
+        key = network if network is not None else target
+        if key in seen or (network is not None and network not in kept):
+            continue
+        seen.add(key)
+        result.append(str(network) if network is not None else target)
+    return result
+
+# Önbellek kaydının anahtarı: aynı hedef farklı port/script seçimiyle yeniden taranabilmeli
+def scan_cache_key(ports, scripts):
+    port_set = sorted({port.strip() for port in ports.split(",") if port.strip()})
+    return f"ports={','.join(port_set)};scripts={','.join(sorted(scripts))}"
+
+# Önbellek dosyasının tamamını (anahtar -> blok listesi) okur
+def read_scan_cache(cache_file):
+    if not cache_file or not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except Exception as e:
+        print(f"Error reading scan cache {cache_file}: {e}")
+        return {}
+    if not isinstance(cache, dict):
+        # Port/script bilgisi içermeyen eski biçim güvenilemez, yok sayılır
+        print(f"Ignoring scan cache {cache_file}: it has no port/script information")
+        return {}
+    return cache
+
+# Bu port/script seçimiyle daha önce taranmış blokları önbellek dosyasından okur
+def load_scanned(cache_file, cache_key):
+    try:
+        return [ipaddress.ip_network(n) for n in read_scan_cache(cache_file).get(cache_key, [])]
+    except ValueError as e:
+        print(f"Error reading scan cache {cache_file}: {e}")
+        return []
+
+# Taranmış blokları birleştirip önbellek dosyasına, diğer port/script kayıtlarını koruyarak atomik olarak yazar
+def save_scanned(cache_file, cache_key, scanned):
+    networks = {4: [], 6: []}
+    for network in scanned:
+        networks[network.version].append(network)
+    cache = read_scan_cache(cache_file)
+    cache[cache_key] = [str(n) for v in networks.values() for n in ipaddress.collapse_addresses(v)]
+    tmp_path = f"{cache_file}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, cache_file)
+
+# Daha önce taranmış bir bloğun içinde kalan hedefleri çıkarır; kısmen taranmış hedeflerden
+# taranmış kısımları düşer (address_exclude). (kalan hedefler, atlanan sayısı, bölünen sayısı) döndürür
+def filter_scanned(targets, scanned):
+    scanned_set = set(scanned)
+    remaining = []
+    skipped = 0
+    split = 0
+    for target in targets:
+        try:
+            network = ipaddress.ip_network(target, strict=False)
+        except ValueError:
+            remaining.append(target)
+            continue
+        if is_covered(network, scanned_set):
+            skipped += 1
+            continue
+
+        parts = [network]
+        for block in scanned:
+            if block.version != network.version or not block.subnet_of(network):
+                continue
+            parts = [rest for part in parts
+                     for rest in (part.address_exclude(block) if block.subnet_of(part) else [part])]
+        if not parts:
+            skipped += 1  # Birden fazla önbellek bloğu hedefi tamamen kaplıyor
+        elif parts != [network]:
+            split += 1
+        remaining.extend(str(part) for part in sorted(parts))
+    return remaining, skipped, split
+
 # Girilen portlara bağlı olarak çalıştırılacak scriptleri belirler
 def determine_scripts(ports):
     smb_scripts = [
@@ -76,42 +182,109 @@ def determine_scripts(ports):
 
     return additional_scripts
 
-# Tek bir hedefi tarar ve Nmap sonuçlarını kaydeder
-def scan_target(target, ports, scanner, output_file, scripts):
-    print(f"Scanning {target} for ports {ports}...")
-    try:
-        script_arguments = f"--script {','.join(scripts)}" if scripts else ""
-        scan_result = scanner.scan(
-            hosts=target,
-            ports=ports,
-            arguments=f"-Pn --open {script_arguments}"
-        )
-        # Nmap çıktısını dosyaya kaydet
-        with open(output_file, 'a') as f:
-            f.write(scanner.get_nmap_output())
-    except Exception as e:
-        print(f"Error scanning {target}: {e}")
+# Hedefleri size uzunluğunda gruplara böler
+def chunk_targets(targets, size):
+    for i in range(0, len(targets), size):
+        yield targets[i:i + size]
+
+# Bir <host> elemanından açık portları, script çıktısı olan portları ve host scriptlerini çıkarır.
+# SMB scriptleri (smb-os-discovery, smb-enum-*) hostrule olduğu için çıktıları <hostscript> altındadır
+def summarize_host(host_elem):
+    address = host_elem.find("address").get("addr")
+    open_ports = []
+    script_ports = []
+    for port in host_elem.iterfind("ports/port"):
+        if port.find("state").get("state") != "open":
+            continue
+        port_id = int(port.get("portid"))
+        open_ports.append(port_id)
+        if port.find("script") is not None:
+            script_ports.append(port_id)
+    host_scripts = [script.get("id") for script in host_elem.iterfind("hostscript/script")]
+    return address, open_ports, script_ports, host_scripts
+
+# Bir hedef grubunu tek nmap süreciyle tarar ve ham XML çıktısını döndürür (G/Ç, iş parçacığında çalışır)
+def run_nmap_batch(batch, ports, scripts):
+    print(f"Scanning {len(batch)} targets ({batch[0]} - {batch[-1]}) for ports {ports}...")
+    command = ["nmap", "-Pn", "--open", "-p", ports, "-iL", "-", "-oX", "-"]
+    if scripts:
+        command[1:1] = ["--script", ",".join(scripts)]
+    result = subprocess.run(command, input=("\n".join(batch) + "\n").encode(),
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        error = result.stderr.decode(errors="replace").strip().splitlines()
+        raise RuntimeError(f"nmap exited with code {result.returncode}: {error[-1] if error else 'no error output'}")
+    return result.stdout
+
+# Nmap XML çıktısını host kayıtlarına ayrıştırır (CPU, ayrı süreçte çalışır)
+def parse_xml_to_records(xml_bytes):
+    records = []
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if elem.tag != "host":
+            continue
+        address, open_ports, script_ports, host_scripts = summarize_host(elem)
+        elem.tail = None  # Hostlar arasındaki boşluklar tekrar yazılmasın
+        records.append((address, open_ports, script_ports, host_scripts, ET.tostring(elem, encoding="unicode")))
+        elem.clear()  # İşlenen hostu bellekten at
+    return records
 
-# Paralel tarama gerçekleştirir ve belirtilen sayıda hedef tarandıktan sonra arayüzü sıfırlar
-def parallel_scan(targets, ports, output_file, max_threads, interface, hosts_limit, scripts):
-    scanner = nmap.PortScanner()
-    processed_hosts = 0  # İşlenen host sayacı
+# Hedefleri hosts_limit uzunluğunda turlar halinde tarar, her turu eşzamanlı nmap gruplarına böler
+# ve turlar arasında arayüzü sıfırlar. XML ayrıştırma GIL'e takılmaması için süreç havuzunda yapılır.
+def batch_scan(targets, ports, output_file, max_batches, interface, hosts_limit, scripts, cache_file=None):
+    cache_key = scan_cache_key(ports, scripts)
+    scanned = load_scanned(cache_file, cache_key)
+    if scanned:
+        targets, skipped, split = filter_scanned(targets, scanned)
+        print(f"Skipping {skipped} targets already in scan cache {cache_file}; "
+              f"{split} partly scanned targets reduced to their unscanned blocks")
 
-    def process_target(target):
-        nonlocal processed_hosts
-        processed_hosts += 1
+    with ProcessPoolExecutor() as parse_pool, open(output_file, 'a') as f:
+        for i, round_targets in enumerate(chunk_targets(targets, hosts_limit)):
+            # Belirtilen host limiti aşıldığında arayüzü sıfırla
+            if i:
+                reset_interface(interface)
 
-        # Belirtilen host limiti aşıldığında arayüzü sıfırla
-        if processed_hosts >= hosts_limit:
-            reset_interface(interface)
-            processed_hosts = 0
+            # Turu en fazla max_batches eşzamanlı gruba dağıt, grup boyutu BATCH_SIZE ile sınırlı
+            size = min(BATCH_SIZE, -(-len(round_targets) // max_batches))
+            parse_futures = {}
+            with ThreadPoolExecutor(max_batches) as executor:
+                nmap_futures = {
+                    executor.submit(run_nmap_batch, batch, ports, scripts): batch
+                    for batch in chunk_targets(round_targets, size)
+                }
+                # Biten nmap çıktısı hemen ayrıştırmaya gönderilir, diğer gruplar taramaya devam eder
+                for future in as_completed(nmap_futures):
+                    batch = nmap_futures[future]
+                    try:
+                        parse_futures[parse_pool.submit(parse_xml_to_records, future.result())] = batch
+                    except Exception as e:
+                        print(f"Error scanning batch {batch[0]} - {batch[-1]}: {e}")
 
-        # Hedefi tara
-        scan_target(target, ports, scanner, output_file, scripts)
+            # Kayıtlar yalnızca bu iş parçacığından yazılır
+            succeeded = []  # Taraması ve ayrıştırması başarılı olan gruplar
+            for future in as_completed(parse_futures):
+                batch = parse_futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    print(f"Error parsing batch {batch[0]} - {batch[-1]}: {e}")
+                    continue
+                for address, open_ports, script_ports, host_scripts, host_xml in records:
+                    print(f"{address}: open ports {open_ports}, script output on {script_ports}, "
+                          f"host scripts {host_scripts}")
+                    f.write(host_xml + "\n")
+                succeeded.append(batch)
+            f.flush()
 
-    # ThreadPoolExecutor kullanarak paralel tarama
-    with ThreadPoolExecutor(max_threads) as executor:
-        executor.map(process_target, targets)
+            # Yalnızca başarılı grupları önbelleğe ekle; başarısız olanlar yeniden çalıştırmada taranır
+            if cache_file and succeeded:
+                for batch in succeeded:
+                    for target in batch:
+                        try:
+                            scanned.append(ipaddress.ip_network(target, strict=False))
+                        except ValueError:
+                            pass
+                save_scanned(cache_file, cache_key, scanned)
 
 # Ana fonksiyon
 def main():
@@ -119,9 +292,10 @@ def main():
     parser = argparse.ArgumentParser(description="Flexible Nmap Scanner with MAC and IP Reset")
     parser.add_argument("-i", "--input", required=True, help="Path to the file containing IP/subnet list")
     parser.add_argument("-p", "--ports", required=True, help="Comma-separated list of ports to scan (e.g., 80,443,3389)")
-    parser.add_argument("-o", "--output", required=True, help="Output file path to save Nmap results")
-    parser.add_argument("-t", "--threads", type=int, default=5, help="Number of parallel threads (default: 5)")
+    parser.add_argument("-o", "--output", required=True, help="Output file path to save Nmap XML host results")
+    parser.add_argument("-t", "--threads", type=int, default=3, help="Number of concurrent nmap batch processes (default: 3)")
     parser.add_argument("-n", "--interface", required=True, help="Network interface to reset (e.g., eth0)")
+    parser.add_argument("-c", "--cache", help="JSON file of networks already scanned with the same ports/scripts; targets inside them are skipped")
     parser.add_argument("-hl", "--hosts-limit", type=int, default=10, help="Number of hosts to scan before resetting interface (default: 10)")
 
     args = parser.parse_args()
@@ -132,14 +306,15 @@ def main():
 
     # Hedefleri oku ve taramayı başlat
     targets = read_targets(args.input)
-    parallel_scan(
+    batch_scan(
         targets,
         args.ports,
         args.output,
         args.threads,
         args.interface,
         args.hosts_limit,
-        scripts
+        scripts,
+        args.cache
     )
 
 if __name__ == "__main__":
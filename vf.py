@@ -1,18 +1,35 @@
 import os
 import ipaddress
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import argparse
-import subprocess
 from scapy.all import *
 
-def is_host_alive(ip):
+CHUNK_SIZE = 4096  # Tek bir sr() çağrısında gönderilecek ICMP paketi sayısı
+MAX_WORKERS = 8
+MAX_INFLIGHT = MAX_WORKERS * 4  # Aynı anda bellekte tutulacak en fazla future sayısı
+
+def ping_sweep(hosts):
+    # Tüm chunk için ICMP paketlerini tek seferde gönderir, cevap verenleri döndürür
     try:
-        result = subprocess.run(["ping", "-c", "1", "-W", "0.1", str(ip)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode == 0:
-            return ip
+        packets = [IP(dst=host) / ICMP() for host in hosts]
+        answered, _ = sr(packets, timeout=2, inter=0, verbose=False)
+        # Yalnızca echo-reply (type 0) canlılık sayılır; unreachable/TTL exceeded gibi ICMP
+        # hataları araya giren yönlendiriciden gelir, sorgulanan hostun kendisinden değil
+        return [sent.dst for sent, received in answered
+                if received.haslayer(ICMP) and received[ICMP].type == 0]
     except Exception as e:
         pass
-    return None
+    return []
+
+def iter_host_chunks(net, size):
+    chunk = []
+    for ip in net.hosts():
+        chunk.append(str(ip))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 def generate_all_private_networks():
     networks = []
@@ -24,14 +41,18 @@ def generate_all_private_networks():
     networks.append("192.168.0.0/16")
     return networks
 
-def detect_vlan(ip):
+def detect_vlans(hosts):
+    # Tüm hostlar için ARP sorgularını tek srp() çağrısında gönderir, VLAN etiketli cevapları toplar
+    vlans = {}
     try:
-        response = srp1(Ether(dst="ff:ff:ff:ff:ff:ff") / Dot1Q(vlan=1) / ARP(pdst=str(ip)), timeout=0.3, verbose=False)
-        if response and response.haslayer(Dot1Q):
-            return response[Dot1Q].vlan
+        packets = [Ether(dst="ff:ff:ff:ff:ff:ff") / Dot1Q(vlan=1) / ARP(pdst=host) for host in hosts]
+        answered, _ = srp(packets, timeout=2, verbose=False)
+        for sent, received in answered:
+            if received.haslayer(Dot1Q):
+                vlans[sent[ARP].pdst] = received[Dot1Q].vlan
     except Exception as e:
         pass
-    return None
+    return vlans
 
 def scan_private_networks(output_file, vlan_output_file, verbose):
     print("[+] Tüm yerel IP adresleri taranıyor...")
@@ -39,40 +60,49 @@ def scan_private_networks(output_file, vlan_output_file, verbose):
     active_hosts = []
     detected_vlans = {}
 
-    with ThreadPoolExecutor(max_workers=1000) as executor:
+    def collect(done):
+        for future in done:
+            for result in future.result():
+                active_hosts.append(result)
+                if verbose:
+                    print(f"[+] Aktif host bulundu: {result}")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:  # Her iş parçacığı bir chunk'ı toplu tarar
         for network in networks:
             net = ipaddress.ip_network(network, strict=False)
             print(f"[+] Tarama başlatıldı: {network}")
-            previous_subnet = None
-            futures = []
-
-            for ip in net.hosts():
-                current_subnet = ipaddress.ip_network(f"{ip}/24", strict=False)
-                if previous_subnet != current_subnet:
-                    print(f"[+] Yeni ağ taranıyor: {current_subnet}")
-                    previous_subnet = current_subnet
-                futures.append(executor.submit(is_host_alive, ip))
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    active_hosts.append(result)
-                    if verbose:
-                        print(f"[+] {result} üzerinde VLAN taraması yapılıyor...")
-                    vlan_id = detect_vlan(result)
-                    if vlan_id:
-                        detected_vlans[result] = vlan_id
+            inflight = set()
+
+            for chunk in iter_host_chunks(net, CHUNK_SIZE):
+                # Pencere doluysa en az bir chunk bitene kadar bekle
+                if len(inflight) >= MAX_INFLIGHT:
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                print(f"[+] Yeni ağ taranıyor: {chunk[0]} - {chunk[-1]}")
+                inflight.add(executor.submit(ping_sweep, chunk))
+
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                collect(done)
+
+    # Çıktının sıralı ve tekrarlanabilir olması için hostlar sayısal IP sırasına göre dizilir
+    active_hosts.sort(key=lambda host: int(ipaddress.IPv4Address(host)))
+
+    # VLAN taraması, canlı host taraması bittikten sonra toplu olarak yapılır
+    print(f"[+] {len(active_hosts)} aktif host üzerinde VLAN taraması yapılıyor...")
+    for i in range(0, len(active_hosts), CHUNK_SIZE):
+        for host, vlan_id in detect_vlans(active_hosts[i:i + CHUNK_SIZE]).items():
+            if vlan_id:
+                detected_vlans[host] = vlan_id
 
     print("\n[+] Tarama tamamlandı.")
     print(f"[+] Aktif IP'ler dosyaya yazılıyor: {output_file}")
-    with open(output_file, "w") as f:
-        for host in active_hosts:
-            f.write(f"{host}\n")
+    with open(output_file, "w", buffering=1 << 20) as f:
+        f.writelines(f"{host}\n" for host in active_hosts)
 
     print(f"[+] Tespit edilen VLAN'lar dosyaya yazılıyor: {vlan_output_file}")
-    with open(vlan_output_file, "w") as f:
-        for host, vlan in detected_vlans.items():
-            f.write(f"{host} - VLAN ID: {vlan}\n")
+    with open(vlan_output_file, "w", buffering=1 << 20) as f:
+        f.writelines(f"{host} - VLAN ID: {vlan}\n" for host, vlan in detected_vlans.items())
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Tüm Yerel IP Adreslerini ve VLAN'ları Tarama Aracı")